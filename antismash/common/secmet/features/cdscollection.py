@@ -9,6 +9,7 @@ from collections import OrderedDict
 from typing import Any, Dict, List, Optional, Sequence, Tuple, Type, TypeVar, Union
 
 from Bio.SeqFeature import SeqFeature
+import numpy as np
 
 from .feature import Feature, FeatureLocation
 from .cds_feature import CDSFeature
@@ -23,7 +24,8 @@ class CDSCollection(Feature):
         A location is required and may extend beyond any CDSFeatures contained
         by the CDSCollection, but cannot be smaller than any CDS added.
     """
-    __slots__ = ["_parent_record", "_contig_edge", "_cdses", "_children", "_parent"]
+    __slots__ = ["_parent_record", "_contig_edge", "_cdses", "_children", "_parent",
+                 "_child_index", "_cds_cache"]
 
     def __init__(self, location: FeatureLocation, feature_type: str,
                  child_collections: Sequence["CDSCollection"] = None) -> None:
@@ -31,7 +33,9 @@ class CDSCollection(Feature):
         self._parent_record: Any = None  # should be Record but will cause circular dependencies
         self._contig_edge = False
         self._cdses: Dict[CDSFeature, None] = OrderedDict()
+        self._cds_cache: Optional[Tuple[CDSFeature, ...]] = None
         self._children = child_collections
+        self._child_index: Optional[Tuple[List["CDSCollection"], np.ndarray, np.ndarray]] = None
         self._parent: Optional["CDSCollection"] = None
         if self._children:
             for child in self._children:
@@ -109,6 +113,21 @@ class CDSCollection(Feature):
             raise ValueError("Cannot determine if on contig edge without parent record")
         return self._contig_edge
 
+    def _build_child_index(self) -> Tuple[List["CDSCollection"], np.ndarray, np.ndarray]:
+        """ Builds an index over child collections for containment lookups,
+            keeping child start and end coordinates in parallel arrays so
+            candidate containers can be found in a single vectorised pass.
+
+            Child collections are fixed at construction time, so the index only
+            needs to be built once.
+        """
+        assert self._children
+        children = list(self._children)
+        starts = np.array([int(child.location.start) for child in children], dtype=np.int64)
+        ends = np.array([int(child.location.end) for child in children], dtype=np.int64)
+        self._child_index = (children, starts, ends)
+        return self._child_index
+
     def add_cds(self, cds: CDSFeature) -> None:
         """ Add a CDS to the collection covered by this feature, also adds to
             any child collections which also contain the CDS feature
@@ -118,9 +137,14 @@ class CDSCollection(Feature):
         if not cds.is_contained_by(self):
             raise ValueError("CDS added is not contained by collection")
         self._cdses[cds] = None
+        self._cds_cache = None
         if not self._children:
             return
-        for child in self._children:
+        children, starts, ends = self._child_index or self._build_child_index()
+        # a child can only contain the CDS if its bounds cover the CDS bounds
+        mask = (starts <= int(cds.location.start)) & (ends >= int(cds.location.end))
+        for i in np.flatnonzero(mask):
+            child = children[i]
             if cds.is_contained_by(child):
                 child.add_cds(cds)
 
@@ -128,7 +152,9 @@ class CDSCollection(Feature):
     def cds_children(self) -> Tuple[CDSFeature, ...]:
         """ Returns the CDSFeatures that have been added to this collection,
             in the order they were added """
-        return tuple(self._cdses)
+        if self._cds_cache is None:
+            self._cds_cache = tuple(self._cdses)
+        return self._cds_cache
 
     @classmethod
     def from_biopython(cls: Type[T], bio_feature: SeqFeature, feature: T = None,
@@ -9,8 +9,8 @@ from typing import Any, Dict, List, Optional, Set, Tuple, Type, TypeVar, Union
 import warnings
 
 from Bio.SeqFeature import SeqFeature
+from Bio.SeqIO.InsdcIO import GenBankWriter
 from Bio.SeqRecord import SeqRecord
-from helperlibs.bio import seqio
 
 from .cdscollection import CDSCollection, CDSFeature
 from .protocluster import Protocluster, SideloadedProtocluster
@@ -60,8 +60,8 @@ class Region(CDSCollection):
         location = combine_locations(child.location for child in children)
 
         super().__init__(location, feature_type=self.FEATURE_TYPE, child_collections=children)
-        self._subregions = subregions
-        self._candidate_clusters = candidate_clusters
+        self._subregions = tuple(subregions)
+        self._candidate_clusters = tuple(candidate_clusters)
 
         self.clusterblast: Optional[List[str]] = None
         self.knownclusterblast: Any = None
@@ -71,13 +71,13 @@ class Region(CDSCollection):
     def subregions(self) -> Tuple[SubRegion, ...]:
         """ Returns a list of SubRegion features used to create this region
         """
-        return tuple(self._subregions)
+        return self._subregions
 
     @property
     def candidate_clusters(self) -> Tuple[CandidateCluster, ...]:
         """ Returns a list of CandidateCluster features used to create this region
         """
-        return tuple(self._candidate_clusters)
+        return self._candidate_clusters
 
     @property
     def products(self) -> List[str]:
@@ -238,7 +238,10 @@ class Region(CDSCollection):
                         parts.append(FeatureLocation(new_start, new_end, part.strand))
                     feature.qualifiers[qual] = [str(build_location_from_others(parts))]
 
-        seqio.write([cluster_record], filename, 'genbank')
+        # write via the genbank writer directly, skipping SeqIO's per-call
+        # format dispatch and writer setup
+        with open(filename, "w") as handle:
+            GenBankWriter(handle).write_file([cluster_record])
 
     def to_biopython(self, qualifiers: Optional[Dict[str, List[str]]] = None) -> List[SeqFeature]:
         if not qualifiers:
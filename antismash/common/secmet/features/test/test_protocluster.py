@@ -12,9 +12,13 @@ from antismash.common.secmet.qualifiers import GeneFunction
 from antismash.common.secmet.test.helpers import DummyCDS
 
 
+# shared between all fixture clusters, as locations are never mutated in place
+CORE_LOCATION = FeatureLocation(8, 71, strand=1)
+SURROUNDS_LOCATION = FeatureLocation(3, 76, strand=1)
+
+
 def create_cluster():
-    cluster = Protocluster(FeatureLocation(8, 71, strand=1),
-                           FeatureLocation(3, 76, strand=1), tool="test",
+    cluster = Protocluster(CORE_LOCATION, SURROUNDS_LOCATION, tool="test",
                            cutoff=17, neighbourhood_range=5, product='a',
                            detection_rule="some rule text",
                            product_category="some category")
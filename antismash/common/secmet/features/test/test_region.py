@@ -59,21 +59,19 @@ class TestRegionChildren(unittest.TestCase):
         with self.assertRaisesRegex(ValueError, "at least one"):
             Region(candidate_clusters=[], subregions=[])
 
+    def gather_children(self):
+        return (self.protocluster.cds_children, self.candidate.cds_children,
+                self.sub.cds_children, self.region.cds_children)
+
     def test_add_cds_propagation(self):
         cds = DummyCDS(0, 10)
         assert cds.is_contained_by(self.region)
         # ensure all empty to start with
-        assert not self.protocluster.cds_children
-        assert not self.candidate.cds_children
-        assert not self.sub.cds_children
-        assert not self.region.cds_children
+        assert self.gather_children() == ((),) * 4
         assert not cds.region
 
         self.region.add_cds(cds)
-        assert self.protocluster.cds_children == (cds,)
-        assert self.candidate.cds_children == (cds,)
-        assert self.sub.cds_children == (cds,)
-        assert self.region.cds_children == (cds,)
+        assert self.gather_children() == ((cds,),) * 4
         assert cds.region is self.region
 
     def test_limited_add_cds_propagation(self):
@@ -82,10 +80,7 @@ class TestRegionChildren(unittest.TestCase):
         self.region = Region(candidate_clusters=[self.candidate], subregions=[self.sub])
 
         # ensure all empty to start with
-        assert not self.protocluster.cds_children
-        assert not self.candidate.cds_children
-        assert not self.sub.cds_children
-        assert not self.region.cds_children
+        assert self.gather_children() == ((),) * 4
         assert not cds.region
 
         self.region.add_cds(cds)
@@ -28,18 +28,39 @@ class RunResult:
         self.command = command
         self.stdout_piped = piped_out
         self.stderr_piped = piped_err
-        if piped_out:
-            self.stdout = stdout.decode()
-        if piped_err:
-            self.stderr = stderr.decode()
+        self._stdout = stdout
+        self._stderr = stderr
+        self._stdout_text: Optional[str] = None
+        self._stderr_text: Optional[str] = None
         self.return_code = return_code
 
-    def __getattribute__(self, attr: str) -> Union[bool, str, int]:
-        if attr == 'stdout' and not self.stdout_piped:
+    @property
+    def stdout_bytes(self) -> bytes:
+        """ The raw, undecoded stdout of the command """
+        if not self.stdout_piped:
             raise ValueError("stdout was redirected to file, unable to access")
-        if attr == 'stderr' and not self.stderr_piped:
+        return self._stdout
+
+    @property
+    def stderr_bytes(self) -> bytes:
+        """ The raw, undecoded stderr of the command """
+        if not self.stderr_piped:
             raise ValueError("stderr was redirected to file, unable to access")
-        return super().__getattribute__(attr)
+        return self._stderr
+
+    @property
+    def stdout(self) -> str:
+        """ The stdout of the command, decoded on first access """
+        if self._stdout_text is None:
+            self._stdout_text = self.stdout_bytes.decode()
+        return self._stdout_text
+
+    @property
+    def stderr(self) -> str:
+        """ The stderr of the command, decoded on first access """
+        if self._stderr_text is None:
+            self._stderr_text = self.stderr_bytes.decode()
+        return self._stderr_text
 
     def successful(self) -> bool:
         """ Returns True if the command exited with an exit code of zero """
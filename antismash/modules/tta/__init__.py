@@ -3,17 +3,37 @@
 
 """Identify TTA codons in BGCs"""
 
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+import importlib
+from typing import Any, Dict, List, Optional, TYPE_CHECKING
 
 from antismash.common.secmet import Record
 from antismash.config import ConfigType
 from antismash.config.args import ModuleArgs
-from antismash.modules.tta.tta import detect, TTAResults
+
+if TYPE_CHECKING:
+    from antismash.modules.tta.tta import TTAResults
 
 NAME = "tta"
 SHORT_DESCRIPTION = "TTA detection"
 
+# the implementation submodule pulls in a long chain of heavier imports, so
+# defer loading it until an analysis function is actually called
+_LAZY_IMPORTS = ("detect", "TTAResults")
+
+
+def __getattr__(name: str) -> Any:
+    # the submodule itself is included, since the previous eager import also
+    # bound it as a package attribute
+    if name == "tta" or name in _LAZY_IMPORTS:
+        module = importlib.import_module("antismash.modules.tta.tta")
+        if name == "tta":
+            return module
+        return getattr(module, name)
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
 
+@lru_cache(maxsize=1)
 def get_arguments() -> ModuleArgs:
     """ Build and return arguments. No extra options beyond a switch to enable """
     args = ModuleArgs('Additional analysis', 'tta', enabled_by_default=True)
@@ -46,15 +66,17 @@ def is_enabled(options: ConfigType) -> bool:
 
 
 def regenerate_previous_results(previous: Dict[str, Any], record: Record,
-                                _options: ConfigType) -> Optional[TTAResults]:
+                                _options: ConfigType) -> Optional["TTAResults"]:
     """ Regenerate the previous results from JSON format. """
+    from antismash.modules.tta.tta import TTAResults
     if not previous:
         return None
     return TTAResults.from_json(previous, record)
 
 
-def run_on_record(record: Record, results: TTAResults, options: ConfigType) -> TTAResults:
+def run_on_record(record: Record, results: "TTAResults", options: ConfigType) -> "TTAResults":
     """ Run the analysis, unless the previous results apply to the given record """
+    from antismash.modules.tta.tta import detect, TTAResults
     if isinstance(results, TTAResults) and results.record_id == record.id:
         return results
     return detect(record, options)
@@ -6,69 +6,65 @@
 
 import logging
 from os import path
+import re
 
-from Bio.SeqFeature import FeatureLocation
-from helperlibs.wrappers.io import TemporaryDirectory
+from Bio.SeqFeature import ExactPosition, FeatureLocation
 
-from antismash.common.fasta import write_fasta
 from antismash.common.secmet import CDSFeature, Record
 from antismash.common.subprocessing import execute
 from antismash.config import ConfigType
 
+# a prodigal SCO gene line, e.g. ">1_337_2799_+"
+_SCO_LINE = re.compile(rb"^>(\d+)_(\d+)_(\d+)_([+-])", re.MULTILINE)
+
 
 def run_prodigal(record: Record, options: ConfigType) -> None:
     """ Run progidal to annotate prokaryotic sequences
     """
-    if "basedir" in options.get('prodigal', ''):
-        basedir = options.prodigal.basedir
-    else:
-        basedir = ""
-    with TemporaryDirectory(change=True):
-        name = record.id.lstrip('-')
-        if not name:
-            name = "unknown"
-        fasta_file = '%s.fasta' % name
-        result_file = '%s.predict' % name
-        write_fasta([name], [str(record.seq)], fasta_file)
+    basedir = getattr(options.get("prodigal"), "basedir", "")
+    name = record.id.lstrip('-')
+    if not name:
+        name = "unknown"
+    fasta = ">%s\n%s\n" % (name, record.seq)
 
-        # run prodigal
-        prodigal = [path.join(basedir, 'prodigal')]
-        prodigal.extend(['-i', fasta_file, '-f', 'sco', '-o', result_file])
-        if options.genefinding_tool == "prodigal-m" or len(record.seq) < 20000:
-            prodigal.extend(['-p', 'meta'])
+    # short sequences can't train prodigal's models, so fall back to meta mode
+    use_meta = options.genefinding_tool == "prodigal-m" or len(record) < 20000
 
-        err = execute(prodigal).stderr
-        if err.find('Error') > -1:
-            logging.error("Failed to run prodigal: %r", err)
-            raise RuntimeError("prodigal error: %s" % err)
-        found = 0
-        with open(result_file, "r") as handle:
-            lines = handle.readlines()
-        for line in lines:
-            # skip first line
-            if not line.startswith('>'):
-                continue
-            name, start_chunk, end_chunk, prodigal_strand = line[1:].rstrip().split("_")
+    # run prodigal, piping the input in and the predictions out to avoid
+    # multiple passes through the filesystem
+    prodigal = [path.join(basedir, 'prodigal'), '-f', 'sco']
+    if use_meta:
+        prodigal.extend(['-p', 'meta'])
 
-            try:
-                start = int(start_chunk)
-                end = int(end_chunk)
-                if prodigal_strand == "+":
-                    strand = 1
-                else:
-                    strand = -1
-            except ValueError:
-                logging.error('Malformatted prodigal output line %r', line.rstrip())
-                continue
+    result = execute(prodigal, stdin=fasta)
+    if b'Error' in result.stderr_bytes:
+        err = result.stderr
+        logging.error("Failed to run prodigal: %r", err)
+        raise RuntimeError("prodigal error: %s" % err)
+    output = result.stdout_bytes
+    features = []
+    locus_prefix = "ctg%s_" % record.record_index
+    for match in _SCO_LINE.finditer(output):
+        name = match.group(1).decode()
+        start = int(match.group(2))
+        end = int(match.group(3))
+        if match.group(4) == b"+":
+            strand = 1
+        else:
+            strand = -1
 
-            if start > end:
-                strand = -1
-                start, end = end, start
+        if start > end:
+            strand = -1
+            start, end = end, start
 
-            loc = FeatureLocation(start-1, end, strand=strand)
-            translation = record.get_aa_translation_from_location(loc)
-            feature = CDSFeature(loc, locus_tag='ctg%s_%s' % (record.record_index, name),
-                                 translation=translation, translation_table=record.transl_table)
-            record.add_cds_feature(feature)
-            found += 1
-    logging.debug("prodigal found %d CDS features", found)
+        # pre-wrapped positions take the fast path in the location constructor
+        loc = FeatureLocation(ExactPosition(start - 1), ExactPosition(end), strand=strand)
+        translation = record.get_aa_translation_from_location(loc)
+        features.append(CDSFeature(loc, locus_tag=locus_prefix + name,
+                                   translation=translation, translation_table=record.transl_table))
+    headers = output.count(b">")
+    if len(features) != headers:
+        logging.error("%d malformatted prodigal output lines", headers - len(features))
+    for feature in features:
+        record.add_cds_feature(feature)
+    logging.debug("prodigal found %d CDS features", len(features))